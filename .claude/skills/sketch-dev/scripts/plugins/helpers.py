@@ -6,11 +6,10 @@ These are extracted to avoid just's parser issues with inline Python.
 """
 
 import sys
-import json
 
 def cmd_crawl(output_path: str):
     """Scrape plugins and save to JSON."""
-    from lib import PluginScraper
+    from lib import PluginScraper, dump_json
 
     print("Scraping Sketch plugins...")
     scraper = PluginScraper()
@@ -31,8 +30,7 @@ def cmd_crawl(output_path: str):
         "is_github": p.is_github
     } for p in plugins]
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    dump_json(data, output_path)
 
     print(f"Saved to {output_path}")
 
@@ -75,12 +73,7 @@ def cmd_search(query: str):
     from lib import PluginState
 
     state = PluginState()
-    query_lower = query.lower()
-
-    matches = [
-        p for p in state.plugins.values()
-        if query_lower in p.name.lower() or query_lower in p.description.lower()
-    ]
+    matches = state.search(query)
 
     print(f'Found {len(matches)} plugins matching "{query}":')
     for p in sorted(matches, key=lambda x: x.name.lower())[:20]:
@@ -116,34 +109,98 @@ def cmd_export_schema(output_path: str):
     print(f"Exported schema to {output_path}")
 
 
+# Built lazily so importing helpers.py doesn't pull in pydantic.
+# Each process (including pool workers) builds the adapter once.
+_ENTRY_LIST_ADAPTER = None
+
+
+def _get_entry_list_adapter():
+    """Get the cached TypeAdapter for validating entry lists."""
+    global _ENTRY_LIST_ADAPTER
+    if _ENTRY_LIST_ADAPTER is None:
+        from pydantic import TypeAdapter
+        from lib.schema import PluginEntry
+        _ENTRY_LIST_ADAPTER = TypeAdapter(list[PluginEntry])
+    return _ENTRY_LIST_ADAPTER
+
+
+def _validate_file(yml_file) -> tuple:
+    """
+    Load and validate a single YAML file.
+
+    Module-level so it can be pickled for ProcessPoolExecutor workers.
+
+    Returns:
+        Tuple of (valid_count, errors)
+    """
+    from yaml import load
+
+    # Prefer LibYAML's C parser when available (~10x faster tokenization).
+    # Optional dependency: libyaml-dev + PyYAML built with --with-libyaml.
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    from pydantic import ValidationError
+
+    errors = []
+
+    with open(yml_file, encoding="utf-8") as f:
+        entries = load(f, Loader=Loader)
+    if not entries:
+        return (0, [])
+
+    # Validate the whole list in one pydantic-core call so the Rust side
+    # iterates entries instead of paying per-call overhead in Python.
+    try:
+        _get_entry_list_adapter().validate_python(entries)
+        return (len(entries), [])
+    except ValidationError as e:
+        invalid_indexes = set()
+        for err in e.errors():
+            loc = err.get("loc", ())
+            idx = loc[0] if loc else None
+            if isinstance(idx, int):
+                invalid_indexes.add(idx)
+                plugin = entries[idx].get("plugin", "?")
+                field = ".".join(str(p) for p in loc[1:]) or "?"
+                errors.append(f"{yml_file.name}: {plugin}: {field}: {err['msg']}")
+            else:
+                errors.append(f"{yml_file.name}: ?: {err['msg']}")
+        return (len(entries) - len(invalid_indexes), errors)
+
+
 def cmd_validate():
     """Validate YAML files against schema."""
-    import yaml
+    from concurrent.futures import ProcessPoolExecutor
     from pathlib import Path
 
     # Import with pydantic availability check
     try:
-        from lib.schema import PluginEntry
+        from lib.schema import PluginEntry  # noqa: F401
     except ImportError:
         print("Error: pydantic not installed. Run: pip install pydantic")
         sys.exit(1)
 
     # Path: helpers.py -> plugins -> scripts -> sketch-dev -> references/plugins
     refs_dir = Path(__file__).parent.parent.parent / "references" / "plugins"
+    files = sorted(refs_dir.glob("*.yml"))
     errors = []
     valid = 0
 
-    for yml_file in sorted(refs_dir.glob("*.yml")):
-        with open(yml_file, encoding="utf-8") as f:
-            entries = yaml.safe_load(f)
-        if not entries:
-            continue
-        for entry in entries:
-            try:
-                PluginEntry.model_validate(entry)
-                valid += 1
-            except Exception as e:
-                errors.append(f"{yml_file.name}: {entry.get('plugin', '?')}: {e}")
+    # Files are independent, so validate them in parallel. Sequential for
+    # small sets where pool startup would dominate.
+    if len(files) < 4:
+        results = map(_validate_file, files)
+        for file_valid, file_errors in results:
+            valid += file_valid
+            errors.extend(file_errors)
+    else:
+        with ProcessPoolExecutor() as executor:
+            for file_valid, file_errors in executor.map(_validate_file, files):
+                valid += file_valid
+                errors.extend(file_errors)
 
     print(f"Validated {valid} entries")
     if errors:
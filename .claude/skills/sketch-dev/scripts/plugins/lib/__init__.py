@@ -3,46 +3,58 @@ Sketch Plugin Tracking Library
 
 Modular components for scraping, tracking, and categorizing Sketch plugins.
 Uses YAML files in references/plugins/*.yml as the source of truth.
+
+Submodules are imported lazily (PEP 562) so CLI commands only pay for what
+they use — e.g. `helpers.py search` loads state without pulling in
+pydantic via schema.
 """
 
-from .schema import (
-    PluginEntry,
-    PluginCategory,
-    VersionInfo,
-    WatchStatus,
-    export_json_schema,
-)
-from .state import PluginState, PluginRecord
-from .scraper import PluginScraper, ScrapedPlugin
-from .differ import PluginDiffer, ChangeType, DiffResult
-from .categorizer import PluginCategorizer, CATEGORIES, to_filename, from_filename
-from .reviewer import ReviewQueue, ReviewItem, ReviewAction, create_review_prompt
-
-__all__ = [
+import importlib
+
+# Map of public names to their defining submodule
+_MODULE_MAP = {
     # Schema (pydantic models)
-    "PluginEntry",
-    "PluginCategory",
-    "VersionInfo",
-    "WatchStatus",
-    "export_json_schema",
+    "PluginEntry": "schema",
+    "PluginCategory": "schema",
+    "VersionInfo": "schema",
+    "export_json_schema": "schema",
     # State management
-    "PluginState",
-    "PluginRecord",
+    "PluginState": "state",
+    "PluginRecord": "state",
+    "WatchStatus": "state",
     # Scraping
-    "PluginScraper",
-    "ScrapedPlugin",
+    "PluginScraper": "scraper",
+    "ScrapedPlugin": "scraper",
     # Diffing
-    "PluginDiffer",
-    "ChangeType",
-    "DiffResult",
+    "PluginDiffer": "differ",
+    "ChangeType": "differ",
+    "DiffResult": "differ",
     # Categorization
-    "PluginCategorizer",
-    "CATEGORIES",
-    "to_filename",
-    "from_filename",
+    "PluginCategorizer": "categorizer",
+    "CATEGORIES": "categorizer",
+    "to_filename": "categorizer",
+    "from_filename": "categorizer",
+    # Serialization
+    "dump_json": "jsonio",
     # Review
-    "ReviewQueue",
-    "ReviewItem",
-    "ReviewAction",
-    "create_review_prompt",
-]
+    "ReviewQueue": "reviewer",
+    "ReviewItem": "reviewer",
+    "ReviewAction": "reviewer",
+    "create_review_prompt": "reviewer",
+}
+
+__all__ = list(_MODULE_MAP)
+
+
+def __getattr__(name: str):
+    """Resolve public names by importing their submodule on first access."""
+    submodule = _MODULE_MAP.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
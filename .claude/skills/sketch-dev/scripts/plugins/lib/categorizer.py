@@ -6,6 +6,12 @@ Keyword-based categorization for Sketch plugins.
 
 from typing import Optional
 
+# Optional: pyahocorasick gives one-pass multi-keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 # Category definitions with priority-ordered keyword patterns
 # More specific patterns come first to avoid mis-categorization
@@ -201,6 +207,31 @@ class PluginCategorizer:
             categories: Optional custom categories dict. Defaults to CATEGORIES.
         """
         self.categories = categories or CATEGORIES
+        self._automaton = self._build_automaton()
+
+    def _build_automaton(self):
+        """
+        Compile all keywords into one Aho-Corasick automaton.
+
+        One DFA pass over the text then replaces a substring test per
+        keyword. Each keyword maps to (priority, category) so matches can
+        reproduce the first-match-wins category order; duplicate keywords
+        keep their highest-priority category. Returns None when
+        pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
+
+        keyword_map = {}
+        for priority, (category, keywords) in enumerate(self.categories.items()):
+            for keyword in keywords:
+                keyword_map.setdefault(keyword.lower(), (priority, category))
+
+        automaton = ahocorasick.Automaton()
+        for keyword, value in keyword_map.items():
+            automaton.add_word(keyword, value)
+        automaton.make_automaton()
+        return automaton
 
     def categorize(self, name: str, description: str) -> str:
         """
@@ -215,6 +246,17 @@ class PluginCategorizer:
         """
         text = f"{name} {description}".lower()
 
+        if self._automaton is not None:
+            best = None
+            for _, (priority, category) in self._automaton.iter(text):
+                # Special handling for Exports vs Imports conflict
+                if category == "Exports" and "import" in text:
+                    continue
+                if best is None or priority < best[0]:
+                    best = (priority, category)
+            return best[1] if best else "Other"
+
+        # Fallback: per-keyword substring scan in priority order
         for category, keywords in self.categories.items():
             for keyword in keywords:
                 if keyword.lower() in text:
@@ -7,16 +7,33 @@ Compares against YAML files in references/plugins/ as the source of truth.
 
 import re
 import json
-import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+from .github import api_get, api_get_conditional, NOT_MODIFIED
 from .state import PluginState, PluginRecord
 from .schema import WatchStatus
 from .scraper import ScrapedPlugin, PluginScraper
 
 
+# Compiled once; extracts owner/repo and stops at query strings or anchors
+_GH_REPO_RE = re.compile(r"github\.com/([^/]+)/([^/?#]+)")
+
+
+def _previous_sha(record: PluginRecord) -> Optional[str]:
+    """Last recorded commit SHA, or None when no SHA is tracked yet.
+
+    PluginRecord stores the SHA in version ('unknown' placeholder when
+    the repo has never been fetched), so treat that as untracked.
+    """
+    version = record.version
+    return version if version and version != "unknown" else None
+
+
 class ChangeType(str, Enum):
     """Type of change detected."""
     NEW = "new"                  # First time seeing this plugin
@@ -26,7 +43,7 @@ class ChangeType(str, Enum):
     REMOVED = "removed"         # No longer in scrape
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
     """Result of comparing a plugin."""
     plugin: ScrapedPlugin
@@ -85,49 +102,90 @@ class PluginDiffer:
     MAJOR_COMMIT_THRESHOLD = 10
     MAJOR_FILES_THRESHOLD = 20
 
+    # Concurrent GitHub API fetches (bounded to stay under rate limits)
+    MAX_CONCURRENT_FETCHES = 8
+
+    # On-disk cache for compare-API results. A (from_sha, to_sha) pair is
+    # immutable, so reruns and CI retries can skip the network entirely.
+    COMPARE_CACHE_DIR = Path.home() / ".cache" / "sketch-plugins" / "compare"
+
     def __init__(self, state: PluginState):
         self.state = state
         self.scraper = PluginScraper()
 
-    def diff_all(self, scraped: list[ScrapedPlugin]) -> list[DiffResult]:
+        # Per-run caches warmed by _prefetch_github_stats
+        self._sha_cache: dict[str, Optional[str]] = {}
+        self._compare_cache: dict[tuple[str, str, str], tuple[int, int]] = {}
+
+    def iter_diffs(self, scraped: list[ScrapedPlugin]) -> Iterator[DiffResult]:
         """
-        Compare all scraped plugins against YAML state.
+        Lazily compare scraped plugins against YAML state.
+
+        Yields a DiffResult per scraped plugin, then one per removed
+        record. Consumers that only aggregate (get_summary,
+        populate_from_diff) never hold the full result list in memory.
 
         Args:
             scraped: List of freshly scraped plugins
-
-        Returns:
-            List of DiffResult for all plugins
         """
-        results = []
         scraped_keys = set()
 
+        # state.plugins is already keyed by normalized link (tracking_key),
+        # so normalize each scraped link once and look up directly instead
+        # of re-normalizing inside get_plugin.
+        by_key = self.state.plugins
+
+        # Warm SHA/compare caches concurrently before the serial
+        # classification pass so _diff_github hits the network at most once
+        # per plugin, in parallel.
+        candidates = []
+        for plugin in scraped:
+            key = plugin.link.lower().rstrip("/")
+            existing = by_key.get(key)
+            if (existing is not None and plugin.is_github
+                    and plugin.updated != existing.updated
+                    and plugin.updated != "Official"):
+                candidates.append((plugin, existing))
+        self._prefetch_github_stats(candidates)
+
         for plugin in scraped:
             key = plugin.link.lower().rstrip("/")
             scraped_keys.add(key)
 
-            existing = self.state.get_plugin(plugin.link)
-            result = self._diff_one(plugin, existing)
-            results.append(result)
+            existing = by_key.get(key)
+            yield self._diff_one(plugin, existing)
 
         # Check for removed plugins
-        for key, record in self.state.plugins.items():
+        for key, record in by_key.items():
             if key not in scraped_keys:
-                results.append(DiffResult(
+                yield DiffResult(
                     plugin=ScrapedPlugin(
                         name=record.name,
                         link=record.link,
                         description=record.description,
                         author=record.author,
-                        updated=record.last_updated,
+                        updated=record.updated,
                         is_github=record.is_github
                     ),
                     change_type=ChangeType.REMOVED,
                     previous_record=record,
                     reason="Plugin no longer listed on Sketch extensions page"
-                ))
+                )
+
+    def diff_all(self, scraped: list[ScrapedPlugin]) -> list[DiffResult]:
+        """
+        Compare all scraped plugins against YAML state.
+
+        Materialized convenience wrapper around iter_diffs for callers
+        that reuse the results for multiple passes.
+
+        Args:
+            scraped: List of freshly scraped plugins
 
-        return results
+        Returns:
+            List of DiffResult for all plugins
+        """
+        return list(self.iter_diffs(scraped))
 
     def _diff_one(self, plugin: ScrapedPlugin, existing: Optional[PluginRecord]) -> DiffResult:
         """Compare single plugin against existing record."""
@@ -140,8 +198,21 @@ class PluginDiffer:
                 reason="First time seeing this plugin"
             )
 
+        # Fast path: same date and same trivial fields means unchanged.
+        # Cheap string compares here skip hashing (and any network work)
+        # for the vast majority of plugins on a typical run.
+        if (plugin.updated == existing.updated
+                and plugin.name == existing.name
+                and plugin.description == existing.description
+                and plugin.author == existing.author):
+            return DiffResult(
+                plugin=plugin,
+                change_type=ChangeType.UNCHANGED,
+                previous_record=existing
+            )
+
         # Check for date change (Sketch page shows "Updated on DATE")
-        if plugin.updated != existing.last_updated and plugin.updated != "Official":
+        if plugin.updated != existing.updated and plugin.updated != "Official":
             # Date changed, need to determine severity
             if plugin.is_github:
                 return self._diff_github(plugin, existing)
@@ -149,7 +220,7 @@ class PluginDiffer:
                 return self._diff_non_github(plugin, existing)
 
         # Check content hash for non-date changes (description changed)
-        if plugin.content_hash != self._compute_existing_hash(existing):
+        if plugin.content_hash != existing.content_hash:
             return DiffResult(
                 plugin=plugin,
                 change_type=ChangeType.UPDATED_MINOR,
@@ -164,17 +235,96 @@ class PluginDiffer:
             previous_record=existing
         )
 
-    def _compute_existing_hash(self, record: PluginRecord) -> str:
-        """Compute content hash for existing record."""
-        import hashlib
-        content = f"{record.name}|{record.description}|{record.author}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+    def _prefetch_github_stats(self, candidates: list[tuple[ScrapedPlugin, PluginRecord]]):
+        """
+        Concurrently fetch SHAs and compare stats for updated GitHub plugins.
+
+        Results land in per-run caches that _diff_github consults, so the
+        serial classification pass never blocks on the network.
+        """
+        if len(candidates) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FETCHES) as executor:
+            # Stage 1: current SHAs for all candidates (conditional where
+            # a stored validator lets GitHub answer with a free 304)
+            shas = executor.map(
+                lambda pair: self._fetch_current_sha(*pair), candidates
+            )
+            for (plugin, _), sha in zip(candidates, shas):
+                self._sha_cache[plugin.link] = sha
+
+            # Stage 2: compare stats where the SHA actually moved
+            jobs = []
+            for plugin, existing in candidates:
+                current_sha = self._sha_cache.get(plugin.link)
+                previous_sha = _previous_sha(existing)
+                if (current_sha and current_sha is not NOT_MODIFIED
+                        and previous_sha and previous_sha != current_sha):
+                    jobs.append((plugin.link, previous_sha, current_sha))
+
+            if jobs:
+                stats = executor.map(lambda job: self._get_github_diff_stats(*job), jobs)
+                for job, result in zip(jobs, stats):
+                    self._compare_cache[job] = result
+
+    def _fetch_current_sha(self, plugin: ScrapedPlugin, existing: PluginRecord):
+        """
+        Fetch the latest commit SHA, using stored HTTP validators.
+
+        When the existing record carries an ETag/Last-Modified from a
+        previous fetch, GitHub can answer 304 without a body (and without
+        charging the rate limit).
+
+        Returns:
+            SHA string, NOT_MODIFIED, or None on failure
+        """
+        match = _GH_REPO_RE.search(plugin.link)
+        if not match:
+            return None
+
+        owner, repo = match.groups()
+        repo = repo.removesuffix(".git")
+        api_url = f"https://api.github.com/repos/{owner}/{repo}/commits?per_page=1"
+
+        data, etag, last_modified = api_get_conditional(
+            api_url,
+            etag=existing.etag,
+            last_modified=existing.last_modified,
+            timeout=10
+        )
+
+        if data is NOT_MODIFIED:
+            return NOT_MODIFIED
+
+        if isinstance(data, list) and len(data) > 0:
+            # Store fresh validators so the next run can short-circuit
+            existing.etag = etag
+            existing.last_modified = last_modified
+            return data[0].get("sha")
+
+        return None
 
     def _diff_github(self, plugin: ScrapedPlugin, existing: PluginRecord) -> DiffResult:
         """Diff a GitHub plugin using commit comparison."""
 
-        previous_sha = existing.github_sha
-        current_sha = self.scraper.fetch_github_sha(plugin.link)
+        previous_sha = _previous_sha(existing)
+        if plugin.link in self._sha_cache:
+            current_sha = self._sha_cache[plugin.link]
+        else:
+            current_sha = self._fetch_current_sha(plugin, existing)
+
+        if current_sha is NOT_MODIFIED:
+            # Repo HEAD is unchanged since the last recorded fetch; the
+            # listing date moved for some other reason
+            return DiffResult(
+                plugin=plugin,
+                change_type=ChangeType.UNCHANGED,
+                previous_record=existing,
+                previous_sha=previous_sha,
+                current_sha=previous_sha,
+                reason="GitHub reports no new commits (304)"
+            )
 
         if not current_sha:
             # Couldn't fetch SHA, assume minor update
@@ -210,9 +360,13 @@ class PluginDiffer:
             plugin.link, previous_sha, current_sha
         )
 
-        commit_count, files_changed = self._get_github_diff_stats(
-            plugin.link, previous_sha, current_sha
-        )
+        cache_key = (plugin.link, previous_sha, current_sha)
+        if cache_key in self._compare_cache:
+            commit_count, files_changed = self._compare_cache[cache_key]
+        else:
+            commit_count, files_changed = self._get_github_diff_stats(
+                plugin.link, previous_sha, current_sha
+            )
 
         # Classify severity
         is_major = (
@@ -256,47 +410,70 @@ class PluginDiffer:
         Returns:
             Tuple of (commit_count, files_changed)
         """
-        match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
+        match = _GH_REPO_RE.search(repo_url)
         if not match:
             return (0, 0)
 
         owner, repo = match.groups()
-        repo = repo.rstrip(".git")
+        repo = repo.removesuffix(".git")
+
+        # Check the on-disk cache first (results for a SHA pair never change)
+        cache_path = self.COMPARE_CACHE_DIR / (
+            f"{owner}_{repo}_{from_sha[:12]}_{to_sha[:12]}.json"
+        )
+        if cache_path.exists():
+            try:
+                cached = json.loads(cache_path.read_text(encoding="utf-8"))
+                return (cached["commits"], cached["files"])
+            except Exception:
+                pass  # Corrupt cache entry; refetch below
 
         # Get compare info from GitHub API
         api_url = f"https://api.github.com/repos/{owner}/{repo}/compare/{from_sha}...{to_sha}"
 
-        try:
-            result = subprocess.run(
-                ["curl", "-s", api_url],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                commits = len(data.get("commits", []))
-                files = len(data.get("files", []))
-                return (commits, files)
-        except Exception:
-            pass
+        data = api_get(api_url, timeout=15)
+        if isinstance(data, dict):
+            commits = len(data.get("commits", []))
+            files = len(data.get("files", []))
+            try:
+                self.COMPARE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(
+                    json.dumps({"commits": commits, "files": files}),
+                    encoding="utf-8"
+                )
+            except OSError:
+                pass  # Cache is best-effort
+            return (commits, files)
 
         return (0, 0)
 
-    def get_summary(self, results: list[DiffResult]) -> dict:
-        """Get summary statistics of diff results."""
+    def get_summary(self, results: Iterable[DiffResult]) -> dict:
+        """Get summary statistics of diff results (single pass)."""
+        counts = Counter()
+        total = 0
+        needs_review = 0
+        skipped = 0
+
+        for r in results:
+            total += 1
+            counts[r.change_type] += 1
+            if r.should_skip:
+                skipped += 1
+            elif r.needs_full_review:
+                needs_review += 1
+
         return {
-            "total": len(results),
-            "new": sum(1 for r in results if r.change_type == ChangeType.NEW),
-            "major_updates": sum(1 for r in results if r.change_type == ChangeType.UPDATED_MAJOR),
-            "minor_updates": sum(1 for r in results if r.change_type == ChangeType.UPDATED_MINOR),
-            "unchanged": sum(1 for r in results if r.change_type == ChangeType.UNCHANGED),
-            "removed": sum(1 for r in results if r.change_type == ChangeType.REMOVED),
-            "needs_review": sum(1 for r in results if r.needs_full_review and not r.should_skip),
-            "skipped": sum(1 for r in results if r.should_skip),
+            "total": total,
+            "new": counts[ChangeType.NEW],
+            "major_updates": counts[ChangeType.UPDATED_MAJOR],
+            "minor_updates": counts[ChangeType.UPDATED_MINOR],
+            "unchanged": counts[ChangeType.UNCHANGED],
+            "removed": counts[ChangeType.REMOVED],
+            "needs_review": needs_review,
+            "skipped": skipped,
         }
 
-    def filter_actionable(self, results: list[DiffResult]) -> list[DiffResult]:
+    def filter_actionable(self, results: Iterable[DiffResult]) -> list[DiffResult]:
         """Filter to only actionable results (not unchanged, not skipped)."""
         return [
             r for r in results
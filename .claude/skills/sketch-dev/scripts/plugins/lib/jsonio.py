@@ -0,0 +1,35 @@
+"""
+JSON Serialization
+
+Shared dump helper for scrape output and review-queue persistence.
+Uses orjson (Rust encoder, ~3-5x faster than stdlib, emits bytes
+directly) when installed; falls back to the stdlib encoder otherwise.
+
+Optional dependency: pip install orjson
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(obj, path):
+    """
+    Serialize obj as indented JSON to path.
+
+    Args:
+        obj: JSON-serializable object
+        path: Destination file path
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
@@ -8,10 +8,10 @@ Supports both programmatic batch processing and interactive MCP-gated review.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Callable
-import json
+from typing import Iterable, Optional, Callable
 
 from .differ import DiffResult, ChangeType
+from .jsonio import dump_json
 from .state import PluginRecord
 from .schema import WatchStatus
 from .categorizer import PluginCategorizer
@@ -26,7 +26,7 @@ class ReviewAction(str, Enum):
     MAJOR_ONLY = "major_only"   # Accept and set to major-only
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewItem:
     """Single item in the review queue."""
     diff_result: DiffResult
@@ -101,7 +101,7 @@ class ReviewQueue:
         self.items: list[ReviewItem] = []
         self._pending_idx = 0
 
-    def populate_from_diff(self, results: list[DiffResult]) -> int:
+    def populate_from_diff(self, results: Iterable[DiffResult]) -> int:
         """
         Populate queue from diff results.
 
@@ -111,9 +111,12 @@ class ReviewQueue:
             Number of items added
         """
         added = 0
+        # One timestamp for the whole batch; items queued together share
+        # the same (immutable) queue_time string
+        now = datetime.utcnow().isoformat()
         for result in results:
             if result.needs_full_review and not result.should_skip:
-                item = ReviewItem(diff_result=result)
+                item = ReviewItem(diff_result=result, queue_time=now)
 
                 # Pre-categorize for new plugins
                 if result.change_type == ChangeType.NEW:
@@ -144,7 +147,8 @@ class ReviewQueue:
         item: ReviewItem,
         action: ReviewAction,
         category: str = None,
-        summary: str = ""
+        summary: str = "",
+        now: str = None
     ):
         """
         Mark an item as reviewed with the given action.
@@ -154,9 +158,10 @@ class ReviewQueue:
             action: Action taken
             category: Final category (defaults to suggested)
             summary: Review summary/notes
+            now: Optional pre-formatted timestamp (for batch callers)
         """
         item.reviewed = True
-        item.review_time = datetime.utcnow().isoformat()
+        item.review_time = now or datetime.utcnow().isoformat()
         item.action = action
         item.final_category = category or item.suggested_category
         item.review_summary = summary
@@ -195,14 +200,14 @@ class ReviewQueue:
                         name=plugin.name,
                         link=plugin.link,
                         description=plugin.description,
-                        author=plugin.author,
+                        authors=(plugin.author,),
                         category=item.final_category or "Other",
-                        last_updated=plugin.updated,
-                        github_sha=item.diff_result.current_sha,
+                        updated=plugin.updated,
+                        version=item.diff_result.current_sha or "unknown",
                         is_github=plugin.is_github,
                         open_source=plugin.is_github,
-                        tags=[item.final_category.lower().replace(" ", "-").replace("/", "-")]
-                        if item.final_category else []
+                        tags=(item.final_category.lower().replace(" ", "-").replace("/", "-"),)
+                        if item.final_category else ()
                     )
 
                     # Set watch status based on action
@@ -222,10 +227,11 @@ class ReviewQueue:
                         on_accept(item, record)
 
                 elif item.action == ReviewAction.REJECT:
-                    # Mark as ignored if exists, otherwise skip
-                    existing = state.get_plugin(item.plugin_link)
-                    if existing:
-                        existing.watch_status = WatchStatus.IGNORE
+                    # Mark as ignored if exists (no-op for unknown links).
+                    # Goes through set_watch_status so the state's status
+                    # index stays in sync; never assign watch_status
+                    # directly on a tracked record.
+                    state.set_watch_status(item.plugin_link, WatchStatus.IGNORE)
                     summary["rejected"] += 1
 
                 elif item.action == ReviewAction.DEFER:
@@ -237,25 +243,28 @@ class ReviewQueue:
         return summary
 
     def get_stats(self) -> dict:
-        """Get queue statistics."""
-        pending = [i for i in self.items if not i.reviewed]
-        reviewed = [i for i in self.items if i.reviewed]
-
+        """Get queue statistics (single pass over items)."""
+        pending = 0
+        reviewed = 0
         by_type = {}
+        by_action = {}
+
         for item in self.items:
             t = item.change_type.value
             by_type[t] = by_type.get(t, 0) + 1
 
-        by_action = {}
-        for item in reviewed:
-            if item.action:
-                a = item.action.value
-                by_action[a] = by_action.get(a, 0) + 1
+            if item.reviewed:
+                reviewed += 1
+                if item.action:
+                    a = item.action.value
+                    by_action[a] = by_action.get(a, 0) + 1
+            else:
+                pending += 1
 
         return {
             "total": len(self.items),
-            "pending": len(pending),
-            "reviewed": len(reviewed),
+            "pending": pending,
+            "reviewed": reviewed,
             "by_change_type": by_type,
             "by_action": by_action,
         }
@@ -267,8 +276,7 @@ class ReviewQueue:
             "stats": self.get_stats(),
             "items": [item.to_dict() for item in self.items]
         }
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        dump_json(data, filepath)
 
     def clear_reviewed(self):
         """Remove reviewed items from queue."""
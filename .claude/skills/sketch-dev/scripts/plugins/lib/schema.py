@@ -2,21 +2,26 @@
 Plugin Schema
 
 Pydantic models for plugin data validation and serialization.
+
+These models serve the untrusted-import and JSON-schema-export paths
+(helpers.py validate/export-schema). The state hot path never touches
+them: PluginState loads raw YAML dicts straight into PluginRecord
+dataclasses, so pydantic is not even imported there.
 """
 
 from datetime import date
-from enum import Enum
+from functools import cached_property
 from typing import Optional, Annotated
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 import re
 
+# WatchStatus lives in state so the state/search paths can load it without
+# importing pydantic; re-exported here for backwards compatibility.
+from .state import WatchStatus
 
-class WatchStatus(str, Enum):
-    """Watch status for tracking updates."""
-    WATCH = "watch"           # Track all updates
-    IGNORE = "ignore"         # Skip all updates
-    MAJOR_ONLY = "major_only" # Only track major updates
-    DEFAULT = "default"       # Use default behavior
+# Precompiled version-string patterns (hot in per-entry validation)
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+_SEMVER_RE = re.compile(r"^v?\d+(\.\d+)*")
 
 
 class VersionInfo(BaseModel):
@@ -24,16 +29,25 @@ class VersionInfo(BaseModel):
     # For GitHub: commit SHA (40 chars)
     # For others: semver string with optional URL
     value: str = Field(..., description="Version string (SHA for GitHub, semver for others)")
-    url: Optional[HttpUrl] = Field(None, description="URL to version info (changelog, release page)")
+    # Plain str with a scheme check: pydantic's HttpUrl runs a full URL
+    # parse per field, which dominates per-entry validation cost
+    url: Optional[str] = Field(None, description="URL to version info (changelog, release page)")
+
+    @field_validator("url")
+    @classmethod
+    def _check_http(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and not v.startswith(("http://", "https://")):
+            raise ValueError("must be an http(s) URL")
+        return v
 
     @field_validator("value")
     @classmethod
     def validate_version(cls, v: str) -> str:
         # Allow SHA (40 hex chars) or semver-like strings
-        if re.match(r"^[0-9a-f]{40}$", v.lower()):
+        if _SHA_RE.match(v.lower()):
             return v.lower()  # Normalize SHA to lowercase
         # Basic semver pattern (loose)
-        if re.match(r"^v?\d+(\.\d+)*", v):
+        if _SEMVER_RE.match(v):
             return v
         # Allow "unknown" for plugins without version info
         if v.lower() in ("unknown", "n/a", ""):
@@ -63,7 +77,7 @@ class PluginEntry(BaseModel):
           Well-maintained with regular updates. React/Vue/Flutter support.
     """
     plugin: str = Field(..., description="Plugin name")
-    link: HttpUrl = Field(..., description="Plugin URL (GitHub repo or homepage)")
+    link: str = Field(..., description="Plugin URL (GitHub repo or homepage)")
     description: str = Field(..., description="Plugin description (from scrape)")
     authors: list[str] = Field(default_factory=list, description="List of author names")
     updated: date = Field(..., description="Last update date (YYYY-MM-DD)")
@@ -81,6 +95,14 @@ class PluginEntry(BaseModel):
     watch_status: Optional[WatchStatus] = Field(None, description="Update tracking status")
     last_reviewed: Optional[date] = Field(None, description="Last review date")
 
+    @field_validator("link")
+    @classmethod
+    def _check_http(cls, v: str) -> str:
+        # Same cheap scheme check as VersionInfo.url (see note there)
+        if not v.startswith(("http://", "https://")):
+            raise ValueError("must be an http(s) URL")
+        return v
+
     model_config = {
         "populate_by_name": True,  # Allow both 'open_source' and 'open-source'
         "json_schema_extra": {
@@ -98,44 +120,25 @@ class PluginEntry(BaseModel):
         }
     }
 
-    @property
+    @cached_property
     def is_github(self) -> bool:
         """Check if plugin is hosted on GitHub."""
-        return "github.com" in str(self.link).lower()
+        return "github.com" in self.link.lower()
 
-    @property
+    @cached_property
     def tracking_key(self) -> str:
         """Unique key for this plugin (normalized link)."""
-        return str(self.link).lower().rstrip("/")
+        return self.link.lower().rstrip("/")
 
     def to_yaml_dict(self) -> dict:
         """Convert to dict for YAML serialization (excludes None values)."""
-        d = {
-            "plugin": self.plugin,
-            "link": str(self.link),
-            "description": self.description,
-            "authors": self.authors,
-            "updated": self.updated.isoformat(),
-            "version": {
-                "value": self.version.value,
-            },
-            "open-source": self.open_source,
-            "tags": self.tags,
-        }
-
-        # Only include version URL if set
-        if self.version.url:
-            d["version"]["url"] = str(self.version.url)
+        # pydantic-core's Rust serializer handles the date/enum coercion
+        # and None-stripping; much cheaper than hand-building the dict
+        d = self.model_dump(mode="json", by_alias=True, exclude_none=True)
 
-        # Include summary if set (research findings from review)
-        if self.summary:
-            d["summary"] = self.summary
-
-        # Only include optional tracking fields if set
-        if self.watch_status and self.watch_status != WatchStatus.DEFAULT:
-            d["watch_status"] = self.watch_status.value
-        if self.last_reviewed:
-            d["last_reviewed"] = self.last_reviewed.isoformat()
+        # DEFAULT means "no explicit preference" and is not persisted
+        if d.get("watch_status") == WatchStatus.DEFAULT.value:
+            del d["watch_status"]
 
         return d
 
@@ -145,8 +148,21 @@ class PluginCategory(BaseModel):
     plugins: list[PluginEntry] = Field(default_factory=list)
 
     @classmethod
-    def from_yaml_list(cls, entries: list[dict]) -> "PluginCategory":
-        """Parse from YAML list format."""
+    def from_yaml_list(cls, entries: list[dict], trusted: bool = False) -> "PluginCategory":
+        """
+        Parse from YAML list format.
+
+        Args:
+            entries: List of entry dicts from YAML
+            trusted: Skip validation via model_construct. Only safe for
+                files this tool wrote itself (to_yaml_dict output);
+                malformed input surfaces as attribute errors later
+                instead of validation warnings here.
+        """
+        if trusted:
+            plugins = [cls._construct_entry(entry) for entry in entries]
+            return cls.model_construct(plugins=plugins)
+
         plugins = []
         for entry in entries:
             try:
@@ -156,6 +172,39 @@ class PluginCategory(BaseModel):
                 print(f"Warning: Invalid entry '{entry.get('plugin', 'unknown')}': {e}")
         return cls(plugins=plugins)
 
+    @staticmethod
+    def _construct_entry(entry: dict) -> PluginEntry:
+        """Build a PluginEntry without validation (trusted input only)."""
+        version_data = entry.get("version") or {}
+        version = VersionInfo.model_construct(
+            value=version_data.get("value", "unknown"),
+            url=version_data.get("url"),
+        )
+
+        # YAML may hand dates back as str or datetime.date depending on
+        # quoting; our own output writes ISO strings
+        updated = entry.get("updated")
+        if isinstance(updated, str):
+            updated = date.fromisoformat(updated)
+        last_reviewed = entry.get("last_reviewed")
+        if isinstance(last_reviewed, str):
+            last_reviewed = date.fromisoformat(last_reviewed)
+
+        watch_str = entry.get("watch_status")
+        return PluginEntry.model_construct(
+            plugin=entry.get("plugin", ""),
+            link=entry.get("link", ""),
+            description=entry.get("description", ""),
+            authors=entry.get("authors", []),
+            updated=updated,
+            version=version,
+            open_source=entry.get("open-source", False),
+            tags=entry.get("tags", []),
+            summary=entry.get("summary"),
+            watch_status=WatchStatus(watch_str) if watch_str else None,
+            last_reviewed=last_reviewed,
+        )
+
 
 def export_json_schema(output_path: str = None) -> dict:
     """
@@ -170,8 +219,7 @@ def export_json_schema(output_path: str = None) -> dict:
     schema = PluginEntry.model_json_schema()
 
     if output_path:
-        import json
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(schema, f, indent=2)
+        from .jsonio import dump_json
+        dump_json(schema, output_path)
 
     return schema
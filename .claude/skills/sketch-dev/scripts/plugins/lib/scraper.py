@@ -11,14 +11,15 @@ Supports three modes:
 import re
 import json
 import hashlib
-import subprocess
 import asyncio
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
+from .github import api_get
 
-@dataclass
+
+@dataclass(slots=True)
 class ScrapedPlugin:
     """Raw plugin data from scraping."""
     name: str
@@ -252,22 +253,12 @@ class PluginScraper:
         owner, repo = match.groups()
         repo = repo.rstrip(".git")
 
-        # Use GitHub API (no auth for public repos)
+        # Use GitHub API (pooled session, see lib/github.py)
         api_url = f"https://api.github.com/repos/{owner}/{repo}/commits?per_page=1"
 
-        try:
-            result = subprocess.run(
-                ["curl", "-s", api_url],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                if isinstance(data, list) and len(data) > 0:
-                    return data[0].get("sha")
-        except Exception:
-            pass
+        data = api_get(api_url, timeout=10)
+        if isinstance(data, list) and len(data) > 0:
+            return data[0].get("sha")
 
         return None
 
@@ -11,39 +11,115 @@ during migration.
 """
 
 import re
+import sys
 import yaml
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Prefer LibYAML's C loader when PyYAML was built with it (~6x faster
+# parse); fall back to the pure-Python implementation. Emitting sticks
+# with the pure-Python SafeDumper: the C emitter escapes non-BMP
+# characters (emoji) despite allow_unicode, and these files double as
+# human-readable docs.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+from yaml import SafeDumper
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import date
+
+from .jsonio import dump_json
+from enum import Enum
+from itertools import groupby
+from operator import attrgetter
 from typing import Optional
 from pathlib import Path
 
-from .schema import WatchStatus
+
+class WatchStatus(str, Enum):
+    """Watch status for tracking updates."""
+    WATCH = "watch"           # Track all updates
+    IGNORE = "ignore"         # Skip all updates
+    MAJOR_ONLY = "major_only" # Only track major updates
+    DEFAULT = "default"       # Use default behavior
+
+
+# Value -> member lookup for parsing YAML (cheaper than catching the
+# ValueError WatchStatus() raises on unknown strings, once per entry)
+_WATCH_VALUES = {s.value: s for s in WatchStatus}
 
 
-# Month name to number mapping for parsing old format
+# Month name to number mapping for parsing old format (abbreviations
+# and full names; shared with migrate_schema.py)
 MONTHS = {
-    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-    "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
+    "jan": 1, "january": 1,
+    "feb": 2, "february": 2,
+    "mar": 3, "march": 3,
+    "apr": 4, "april": 4,
+    "may": 5,
+    "jun": 6, "june": 6,
+    "jul": 7, "july": 7,
+    "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10,
+    "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
 }
 
+# Precompiled patterns for old-schema summary parsing (hot in _load)
+_DATE_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})")
+_AUTHOR_RE = re.compile(r"By\s+([^.]+)\.")
+_AUTHOR_SPLIT_RE = re.compile(r",\s*|\s+and\s+")
+_LAST_UPDATED_RE = re.compile(r"Last updated (.+)\.$")
+
+
+# Shared author/tag tuples: the same values recur across many records
+# ("Unknown", one tag per category), so duplicates share one allocation
+_TUPLE_INTERN: dict[tuple, tuple] = {}
+
+
+def _intern_tuple(values) -> tuple:
+    """Intern a sequence of strings as a shared tuple."""
+    t = tuple(sys.intern(v) if isinstance(v, str) else v for v in values)
+    return _TUPLE_INTERN.setdefault(t, t)
+
+
+def _json_safe_entry(entry: dict) -> dict:
+    """Copy an entry with YAML date objects coerced to ISO strings."""
+    out = dict(entry)
+    for key in ("updated", "last_reviewed"):
+        value = out.get(key)
+        if isinstance(value, date):
+            out[key] = value.isoformat()
+    return out
+
+
+def _normalize_key(link: str) -> str:
+    """Normalize a plugin link into its tracking key."""
+    return link.lower().rstrip("/")
+
 
 def parse_date_string(date_str: str) -> Optional[str]:
     """Parse date string like '6 Jan 2026' to '2026-01-06'."""
-    match = re.search(r"(\d{1,2})\s+(\w+)\s+(\d{4})", date_str)
+    match = _DATE_RE.search(date_str)
     if match:
         day = int(match.group(1))
         month_name = match.group(2).lower()
         year = int(match.group(3))
         month = MONTHS.get(month_name)
         if month:
+            # date() is only a range check here; formatting stays an
+            # f-string, which is far cheaper than strftime
             try:
-                return f"{year:04d}-{month:02d}-{day:02d}"
+                date(year, month, day)
             except ValueError:
-                pass
+                return None
+            return f"{year:04d}-{month:02d}-{day:02d}"
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginRecord:
     """Record for a single plugin with tracking metadata."""
     # Core identity
@@ -52,7 +128,7 @@ class PluginRecord:
 
     # Metadata
     description: str = ""
-    authors: list = field(default_factory=list)  # List of authors
+    authors: tuple = ()  # Interned author names (see _intern_tuple)
     category: str = "Other"
     updated: str = ""  # YYYY-MM-DD format
 
@@ -63,19 +139,60 @@ class PluginRecord:
     # Research summary (populated during review pipeline)
     summary: Optional[str] = None  # Findings from exploration/review
 
-    # Watch status
+    # Watch status. On records tracked by a PluginState, change it via
+    # PluginState.set_watch_status so the status index stays in sync.
     watch_status: WatchStatus = WatchStatus.DEFAULT
     last_reviewed: Optional[str] = None
+    review_summary: Optional[str] = None  # Set by ReviewQueue.apply_to_state
+
+    # HTTP validators from the last GitHub API fetch (for conditional GETs)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
     # Computed
     is_github: bool = False
     open_source: bool = False
-    tags: list = field(default_factory=list)
+    tags: tuple = ()  # Interned category tags
+
+    # Lazily computed caches (see content_hash / *_lower properties)
+    _content_hash: Optional[str] = field(default=None, repr=False, compare=False)
+    _name_lower: Optional[str] = field(default=None, repr=False, compare=False)
+    _description_lower: Optional[str] = field(default=None, repr=False, compare=False)
+
+    # Cached at construction: the key is read on every dict operation in
+    # PluginState, so normalizing the link once beats a per-access rstrip
+    _tracking_key: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._tracking_key = _normalize_key(self.link)
 
     @property
     def tracking_key(self) -> str:
         """Unique key for this plugin (normalized link)."""
-        return self.link.lower().rstrip("/")
+        return self._tracking_key
+
+    @property
+    def content_hash(self) -> str:
+        """Hash of content for change detection (cached after first access)."""
+        if self._content_hash is None:
+            import hashlib
+            content = f"{self.name}|{self.description}|{self.author}"
+            self._content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+        return self._content_hash
+
+    @property
+    def name_lower(self) -> str:
+        """Lowercased name for case-insensitive search (cached)."""
+        if self._name_lower is None:
+            self._name_lower = self.name.lower()
+        return self._name_lower
+
+    @property
+    def description_lower(self) -> str:
+        """Lowercased description for case-insensitive search (cached)."""
+        if self._description_lower is None:
+            self._description_lower = self.description.lower()
+        return self._description_lower
 
     @property
     def author(self) -> str:
@@ -112,13 +229,13 @@ class PluginRecord:
             updated = ""
 
             # Extract author(s)
-            author_match = re.match(r"By\s+([^.]+)\.", summary)
+            author_match = _AUTHOR_RE.match(summary)
             if author_match:
                 author_text = author_match.group(1).strip()
-                authors = [a.strip() for a in re.split(r",\s*|\s+and\s+", author_text)]
+                authors = [a.strip() for a in _AUTHOR_SPLIT_RE.split(author_text)]
 
             # Extract and convert date
-            date_match = re.search(r"Last updated (.+)\.$", summary)
+            date_match = _LAST_UPDATED_RE.search(summary)
             if date_match:
                 date_str = date_match.group(1).strip()
                 updated = parse_date_string(date_str) or date_str
@@ -127,18 +244,15 @@ class PluginRecord:
             version = entry.get("github_sha", "unknown")
             version_url = None
 
-        # Parse watch status
-        watch_str = entry.get("watch_status", "default")
-        try:
-            watch_status = WatchStatus(watch_str)
-        except ValueError:
-            watch_status = WatchStatus.DEFAULT
+        # Parse watch status (unknown values fall back to DEFAULT)
+        watch_status = _WATCH_VALUES.get(
+            entry.get("watch_status", "default"), WatchStatus.DEFAULT)
 
         return cls(
             name=entry.get("plugin", ""),
             link=link,
             description=entry.get("description", ""),
-            authors=authors if authors else ["Unknown"],
+            authors=_intern_tuple(authors if authors else ["Unknown"]),
             category=category,
             updated=updated,
             version=version,
@@ -146,40 +260,42 @@ class PluginRecord:
             summary=entry.get("summary"),  # Research summary from review
             watch_status=watch_status,
             last_reviewed=entry.get("last_reviewed"),
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
             is_github=is_github,
             open_source=entry.get("open-source", is_github),
-            tags=entry.get("tags", [])
+            # "or ()" also covers an explicit null tags: in hand-edited YAML
+            tags=_intern_tuple(entry.get("tags") or ())
         )
 
     def to_yaml_entry(self) -> dict:
         """Convert to YAML entry format (new schema)."""
-        entry = {
+        version = {"value": self.version}
+        if self.version_url:
+            version["url"] = self.version_url
+
+        # Optional fields are omitted when unset (to keep YAML clean)
+        optional = {
+            "summary": self.summary,
+            "watch_status": (self.watch_status.value
+                             if self.watch_status != WatchStatus.DEFAULT else None),
+            "last_reviewed": self.last_reviewed,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+
+        return {
             "plugin": self.name,
             "link": self.link,
             "description": self.description,
-            "authors": self.authors,
+            "authors": list(self.authors),
             "updated": self.updated,
-            "version": {"value": self.version},
+            "version": version,
             "open-source": self.open_source,
-            "tags": self.tags or [self.category.lower().replace(" ", "-").replace("/", "-")]
+            "tags": list(self.tags) or [self.category.lower().replace(" ", "-").replace("/", "-")],
+            **{k: v for k, v in optional.items() if v},
         }
 
-        # Add version URL if set
-        if self.version_url:
-            entry["version"]["url"] = self.version_url
-
-        # Include summary if set (research findings from review)
-        if self.summary:
-            entry["summary"] = self.summary
-
-        # Only include tracking fields if set (to keep YAML clean)
-        if self.watch_status != WatchStatus.DEFAULT:
-            entry["watch_status"] = self.watch_status.value
-        if self.last_reviewed:
-            entry["last_reviewed"] = self.last_reviewed
-
-        return entry
-
 
 class PluginState:
     """
@@ -188,8 +304,18 @@ class PluginState:
     The YAML files in references/plugins/*.yml serve dual purposes:
     1. Human-readable plugin documentation by category
     2. Version tracking state (dates, SHA, watch status)
+
+    Storage is a dict of PluginRecord keyed by normalized link. The
+    catalog is small (hundreds of entries) and consumers mutate records
+    in place, so a columnar layout would cost conversions on every
+    save/update for no measurable scan win at this size.
     """
 
+    # Parsed-entry cache keyed by file mtime, so repeated CLI invocations
+    # skip the YAML parse for unchanged files (same layout as the
+    # differ's compare cache)
+    PARSE_CACHE_DIR = Path.home() / ".cache" / "sketch-plugins" / "state"
+
     def __init__(self, plugins_dir: str = None):
         """
         Initialize plugin state.
@@ -207,32 +333,124 @@ class PluginState:
         self.plugins: dict[str, PluginRecord] = {}
         self._category_map: dict[str, str] = {}  # link -> category
 
+        # Maintained indexes so category/status/github queries and stats
+        # are O(1) instead of sweeping every record
+        self._by_category: dict[str, set[str]] = {}
+        self._by_status: dict[WatchStatus, set[str]] = {s: set() for s in WatchStatus}
+        self._github_keys: set[str] = set()
+
+        # Search index (built lazily by search(), cleared on mutation)
+        self._search_blob: Optional[bytes] = None
+        self._search_offsets: list[int] = []
+        self._search_records: list[PluginRecord] = []
+
         self._load()
 
+    def _cache_path(self) -> Path:
+        """Cache file for this plugins_dir (keyed by resolved path)."""
+        import hashlib
+        digest = hashlib.sha1(
+            str(self.plugins_dir.resolve()).encode()).hexdigest()[:16]
+        return self.PARSE_CACHE_DIR / f"{digest}.json"
+
     def _load(self):
         """Load state from all YAML files."""
         if not self.plugins_dir.exists():
             return
 
-        for yaml_file in self.plugins_dir.glob("*.yml"):
+        files = sorted(self.plugins_dir.glob("*.yml"))
+        if not files:
+            return
+
+        # Pull parsed entries from the mtime cache where still fresh
+        cache_path = self._cache_path()
+        try:
+            import json
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+
+        file_entries: dict[Path, list] = {}
+        to_parse: list[tuple[Path, int]] = []
+        for yaml_file in files:
+            mtime = yaml_file.stat().st_mtime_ns
+            hit = cached.get(yaml_file.name)
+            if (isinstance(hit, dict) and hit.get("mtime") == mtime
+                    and isinstance(hit.get("entries"), list)):
+                file_entries[yaml_file] = hit["entries"]
+            else:
+                to_parse.append((yaml_file, mtime))
+
+        def _parse(yaml_file: Path):
+            with open(yaml_file, "r", encoding="utf-8") as f:
+                return yaml.load(f, Loader=SafeLoader)
+
+        # Parse stale/missing files in a thread pool: reads block on I/O
+        # and LibYAML's C parser releases the GIL, so parses overlap
+        # across files. The merge into self.plugins stays single-threaded
+        # below.
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_parse))) as pool:
+                futures = {pool.submit(_parse, f): (f, mtime)
+                           for f, mtime in to_parse}
+                for future in as_completed(futures):
+                    yaml_file, mtime = futures[future]
+                    try:
+                        entries = [_json_safe_entry(e)
+                                   for e in (future.result() or [])]
+                    except Exception as e:
+                        # Parse failures and malformed entry shapes both
+                        # skip the file with a warning (as serial loading
+                        # always did) instead of killing the whole load
+                        print(f"Warning: Failed to load {yaml_file}: {e}")
+                        continue
+                    file_entries[yaml_file] = entries
+                    cached[yaml_file.name] = {"mtime": mtime,
+                                              "entries": entries}
+
+        # Merge in glob order regardless of completion order. A bad file
+        # (fresh or from the cache) warns and is skipped, same as above.
+        for yaml_file in files:
+            entries = file_entries.get(yaml_file)
+            if not entries:
+                continue
+
             # Derive category from filename
             category = self._filename_to_category(yaml_file.stem)
 
             try:
-                with open(yaml_file, "r", encoding="utf-8") as f:
-                    entries = yaml.safe_load(f)
-
-                if not entries:
-                    continue
-
                 for entry in entries:
                     record = PluginRecord.from_yaml_entry(entry, category)
                     key = record.tracking_key
                     self.plugins[key] = record
                     self._category_map[key] = category
-
+                    self._index_add(key, record)
             except Exception as e:
                 print(f"Warning: Failed to load {yaml_file}: {e}")
+                # Evict any cached copy of the bad file (the rewrite
+                # check below sees the missing name and persists this)
+                cached.pop(yaml_file.name, None)
+
+        # Rewrite the cache if anything was reparsed or files went away
+        current = {f.name for f in files}
+        if to_parse or set(cached) != current:
+            self._write_parse_cache(
+                {name: data for name, data in cached.items()
+                 if name in current},
+                cache_path)
+
+    def _write_parse_cache(self, cache: dict, cache_path: Path):
+        """Atomically persist the parse cache (best effort)."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            dump_json(cache, tmp_path)
+            tmp_path.replace(cache_path)
+        except (OSError, TypeError, ValueError):
+            # TypeError covers YAML-native values _json_safe_entry does
+            # not coerce (e.g. an unquoted date nested under version);
+            # a cache miss next run is fine, a crashed load is not
+            pass
 
     def _filename_to_category(self, stem: str) -> str:
         """Convert filename stem to category name."""
@@ -254,38 +472,100 @@ class PluginState:
 
     def save(self):
         """Save state back to YAML files (new schema)."""
-        # Group plugins by category
-        by_category: dict[str, list[PluginRecord]] = {}
-
-        for record in self.plugins.values():
-            cat = record.category
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(record)
-
         # Ensure directory exists
         self.plugins_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write each category file
-        for category, records in by_category.items():
-            filename = self._category_to_filename(category)
-            filepath = self.plugins_dir / filename
+        # One stable sort groups records per category file; the stable
+        # sort keeps load order within each category, and only one
+        # category's entry dicts are materialized at a time (instead of
+        # a dict of lists covering the whole catalog)
+        by_category = attrgetter("category")
+        records = sorted(self.plugins.values(), key=by_category)
 
-            entries = [r.to_yaml_entry() for r in records]
+        for category, group in groupby(records, key=by_category):
+            filepath = self.plugins_dir / self._category_to_filename(category)
 
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write("---\n")
-                yaml.dump(entries, f, default_flow_style=False,
+                yaml.dump([r.to_yaml_entry() for r in group], f,
+                          Dumper=SafeDumper, default_flow_style=False,
                           allow_unicode=True, sort_keys=False)
 
     def _category_to_filename(self, category: str) -> str:
         """Convert category name to filename."""
         return category.lower().replace(" ", "-").replace("/", "-") + ".yml"
 
+    def _index_add(self, key: str, record: PluginRecord):
+        """Add a record's key to the category/status/github indexes."""
+        self._by_category.setdefault(record.category, set()).add(key)
+        self._by_status[record.watch_status].add(key)
+        if record.is_github:
+            self._github_keys.add(key)
+
+    def _index_discard(self, key: str, record: PluginRecord):
+        """Remove a record's key from the indexes (prunes empty buckets)."""
+        bucket = self._by_category.get(record.category)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._by_category[record.category]
+        self._by_status[record.watch_status].discard(key)
+        self._github_keys.discard(key)
+
+    def _build_search_index(self):
+        """
+        Build a joined byte buffer over all name/description pairs.
+
+        One bytes.find over the blob uses CPython's C fastsearch instead
+        of a Python-level loop over records. Records are separated by
+        \\x00 and name/description within a record by \\x01, so a query
+        can never match across record boundaries.
+        """
+        records = list(self.plugins.values())
+        parts = []
+        offsets = []
+        pos = 0
+
+        for record in records:
+            part = (record.name_lower + "\x01" + record.description_lower).encode("utf-8")
+            offsets.append(pos)
+            parts.append(part)
+            pos += len(part) + 1  # +1 for the \x00 separator
+
+        self._search_records = records
+        self._search_offsets = offsets
+        self._search_blob = b"\x00".join(parts)
+
+    def _invalidate_search_index(self):
+        """Drop the search index after a mutation."""
+        self._search_blob = None
+
+    def search(self, query: str) -> list[PluginRecord]:
+        """
+        Case-insensitive substring search over names and descriptions.
+
+        Returns matching records in load order.
+        """
+        if self._search_blob is None:
+            self._build_search_index()
+
+        query_bytes = query.lower().encode("utf-8")
+        if not query_bytes:
+            return []
+
+        blob = self._search_blob
+        offsets = self._search_offsets
+        hits = set()
+        idx = 0
+        while (pos := blob.find(query_bytes, idx)) != -1:
+            hits.add(bisect_right(offsets, pos) - 1)
+            idx = pos + 1
+
+        return [self._search_records[i] for i in sorted(hits)]
+
     def get_plugin(self, link: str) -> Optional[PluginRecord]:
         """Get plugin by link."""
-        key = link.lower().rstrip("/")
-        return self.plugins.get(key)
+        return self.plugins.get(_normalize_key(link))
 
     def add_or_update(self, record: PluginRecord) -> bool:
         """
@@ -297,8 +577,13 @@ class PluginState:
         key = record.tracking_key
         is_new = key not in self.plugins
 
+        if not is_new:
+            self._index_discard(key, self.plugins[key])
+
         self.plugins[key] = record
         self._category_map[key] = record.category
+        self._index_add(key, record)
+        self._invalidate_search_index()
         return is_new
 
     def remove(self, link: str) -> bool:
@@ -308,22 +593,27 @@ class PluginState:
         Returns:
             True if removed, False if not found
         """
-        key = link.lower().rstrip("/")
+        key = _normalize_key(link)
         if key in self.plugins:
+            self._index_discard(key, self.plugins[key])
             del self.plugins[key]
             self._category_map.pop(key, None)
+            self._invalidate_search_index()
             return True
         return False
 
     def set_watch_status(self, link: str, status: WatchStatus):
         """Set watch status for a plugin."""
-        key = link.lower().rstrip("/")
-        if key in self.plugins:
-            self.plugins[key].watch_status = status
+        key = _normalize_key(link)
+        record = self.plugins.get(key)
+        if record is not None:
+            self._by_status[record.watch_status].discard(key)
+            record.watch_status = status
+            self._by_status[status].add(key)
 
     def get_by_status(self, status: WatchStatus) -> list[PluginRecord]:
         """Get all plugins with a specific watch status."""
-        return [p for p in self.plugins.values() if p.watch_status == status]
+        return [self.plugins[k] for k in self._by_status[status]]
 
     def get_watched(self) -> list[PluginRecord]:
         """Get all explicitly watched plugins."""
@@ -335,29 +625,25 @@ class PluginState:
 
     def get_by_category(self, category: str) -> list[PluginRecord]:
         """Get all plugins in a category."""
-        return [p for p in self.plugins.values() if p.category == category]
+        return [self.plugins[k] for k in self._by_category.get(category, ())]
 
     def get_github_plugins(self) -> list[PluginRecord]:
         """Get all GitHub-hosted plugins."""
-        return [p for p in self.plugins.values() if p.is_github]
+        return [self.plugins[k] for k in self._github_keys]
 
     def get_stats(self) -> dict:
-        """Get summary statistics."""
-        watched = sum(1 for p in self.plugins.values()
-                      if p.watch_status == WatchStatus.WATCH)
-        ignored = sum(1 for p in self.plugins.values()
-                      if p.watch_status == WatchStatus.IGNORE)
-        major_only = sum(1 for p in self.plugins.values()
-                         if p.watch_status == WatchStatus.MAJOR_ONLY)
+        """Get summary statistics (O(1) reads from maintained indexes)."""
+        total = len(self.plugins)
+        github = len(self._github_keys)
 
         return {
-            "total": len(self.plugins),
-            "watched": watched,
-            "ignored": ignored,
-            "major_only": major_only,
-            "github": sum(1 for p in self.plugins.values() if p.is_github),
-            "non_github": sum(1 for p in self.plugins.values() if not p.is_github),
-            "categories": len(set(p.category for p in self.plugins.values())),
+            "total": total,
+            "watched": len(self._by_status[WatchStatus.WATCH]),
+            "ignored": len(self._by_status[WatchStatus.IGNORE]),
+            "major_only": len(self._by_status[WatchStatus.MAJOR_ONLY]),
+            "github": github,
+            "non_github": total - github,
+            "categories": len(self._by_category),
         }
 
     def get_all_links(self) -> set[str]:
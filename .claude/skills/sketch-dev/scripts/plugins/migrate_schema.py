@@ -15,26 +15,26 @@ Usage:
 import argparse
 import re
 import yaml
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Prefer LibYAML's C loader when PyYAML was built with it; emit with
+# the pure-Python SafeDumper so emoji stay literal (the C emitter
+# escapes non-BMP characters despite allow_unicode)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+from yaml import SafeDumper
 from pathlib import Path
 from typing import Optional
 
+from lib.github import api_get
+from lib.state import parse_date_string
 
-# Month name to number mapping
-MONTHS = {
-    "jan": 1, "january": 1,
-    "feb": 2, "february": 2,
-    "mar": 3, "march": 3,
-    "apr": 4, "april": 4,
-    "may": 5,
-    "jun": 6, "june": 6,
-    "jul": 7, "july": 7,
-    "aug": 8, "august": 8,
-    "sep": 9, "sept": 9, "september": 9,
-    "oct": 10, "october": 10,
-    "nov": 11, "november": 11,
-    "dec": 12, "december": 12,
-}
+# Precompiled patterns (reused across every entry/file)
+_AUTHOR_RE = re.compile(r"By\s+([^.]+)\.")
+_AUTHOR_SPLIT_RE = re.compile(r",\s*|\s+and\s+")
+_GH_RE = re.compile(r"github\.com/([^/]+)/([^/]+)")
 
 
 def parse_summary(summary: str) -> tuple[list[str], Optional[str]]:
@@ -45,67 +45,68 @@ def parse_summary(summary: str) -> tuple[list[str], Optional[str]]:
     Output: (["Tobias Fried"], "2026-01-06")
     """
     authors = []
-    date_str = None
 
     # Extract author(s)
     # Pattern: "By Author Name." or "By Author1, Author2."
-    author_match = re.match(r"By\s+([^.]+)\.", summary)
+    author_match = _AUTHOR_RE.match(summary)
     if author_match:
         author_text = author_match.group(1).strip()
         # Split by comma or "and"
-        authors = [a.strip() for a in re.split(r",\s*|\s+and\s+", author_text)]
+        authors = [a.strip() for a in _AUTHOR_SPLIT_RE.split(author_text)]
 
     # Extract date
-    # Pattern: "Last updated DD Mon YYYY." or just the date
-    date_match = re.search(r"(\d{1,2})\s+(\w+)\s+(\d{4})", summary)
-    if date_match:
-        day = int(date_match.group(1))
-        month_name = date_match.group(2).lower()
-        year = int(date_match.group(3))
-
-        month = MONTHS.get(month_name)
-        if month:
-            try:
-                d = datetime(year, month, day)
-                date_str = d.strftime("%Y-%m-%d")
-            except ValueError:
-                pass
+    # Pattern: "Last updated DD Mon YYYY." or just the date (the shared
+    # helper range-checks and formats without datetime/strftime)
+    date_str = parse_date_string(summary)
 
     return authors, date_str
 
 
 def fetch_github_sha(repo_url: str) -> Optional[str]:
     """Fetch latest commit SHA for a GitHub repo."""
-    import subprocess
-    import json
-
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
+    match = _GH_RE.search(repo_url)
     if not match:
         return None
 
     owner, repo = match.groups()
-    repo = repo.rstrip(".git")
+    repo = repo.removesuffix(".git")
 
     api_url = f"https://api.github.com/repos/{owner}/{repo}/commits?per_page=1"
 
-    try:
-        result = subprocess.run(
-            ["curl", "-s", api_url],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            if isinstance(data, list) and len(data) > 0:
-                return data[0].get("sha")
-    except Exception:
-        pass
+    data = api_get(api_url, timeout=10)
+    if isinstance(data, list) and len(data) > 0:
+        return data[0].get("sha")
 
     return None
 
 
-def migrate_entry(entry: dict, fetch_sha: bool = False) -> dict:
+def fetch_all_shas(repo_urls: list[str], max_workers: int = 8) -> dict[str, Optional[str]]:
+    """
+    Fetch latest commit SHAs for many repos concurrently.
+
+    Serial fetches paid one full round trip per repo; a bounded thread
+    pool over the shared pooled session overlaps the requests while
+    staying polite to the API rate limit.
+
+    Returns:
+        Dict mapping repo_url -> SHA (or None when the fetch failed)
+    """
+    shas: dict[str, Optional[str]] = {}
+    if not repo_urls:
+        return shas
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(repo_urls))) as pool:
+        futures = {pool.submit(fetch_github_sha, url): url for url in repo_urls}
+        for future in as_completed(futures):
+            try:
+                shas[futures[future]] = future.result()
+            except Exception:
+                shas[futures[future]] = None
+
+    return shas
+
+
+def migrate_entry(entry: dict, sha_map: Optional[dict] = None) -> dict:
     """Migrate a single plugin entry to new schema."""
     new_entry = {}
 
@@ -121,15 +122,12 @@ def migrate_entry(entry: dict, fetch_sha: bool = False) -> dict:
     new_entry["authors"] = authors if authors else ["Unknown"]
     new_entry["updated"] = date_str if date_str else "1970-01-01"
 
-    # Determine version
+    # Determine version (SHAs are prefetched in bulk by migrate_file)
     link = entry.get("link", "")
     is_github = "github.com" in link.lower()
 
-    if is_github and fetch_sha:
-        sha = fetch_github_sha(link)
-        new_entry["version"] = {"value": sha if sha else "unknown"}
-    else:
-        new_entry["version"] = {"value": "unknown"}
+    sha = sha_map.get(link) if (is_github and sha_map is not None) else None
+    new_entry["version"] = {"value": sha if sha else "unknown"}
 
     # Copy other fields
     new_entry["open-source"] = entry.get("open-source", is_github)
@@ -156,11 +154,25 @@ def migrate_file(filepath: Path, dry_run: bool = True, fetch_sha: bool = False)
     Returns number of entries migrated.
     """
     with open(filepath, "r", encoding="utf-8") as f:
-        entries = yaml.safe_load(f)
+        entries = yaml.load(f, Loader=SafeLoader)
 
     if not entries:
         return 0
 
+    # Already fully migrated: nothing to do, and skipping the rewrite
+    # keeps the file's mtime (and any mtime-based caches) intact
+    if all("authors" in entry for entry in entries):
+        return 0
+
+    # Prefetch SHAs for every GitHub entry needing migration in one
+    # concurrent batch instead of one blocking fetch per entry
+    sha_map = None
+    if fetch_sha:
+        gh_links = [e.get("link", "") for e in entries
+                    if "authors" not in e
+                    and "github.com" in e.get("link", "").lower()]
+        sha_map = fetch_all_shas(gh_links)
+
     migrated = []
     for entry in entries:
         # Skip if already migrated (has 'authors' field)
@@ -168,13 +180,13 @@ def migrate_file(filepath: Path, dry_run: bool = True, fetch_sha: bool = False)
             migrated.append(entry)
             continue
 
-        new_entry = migrate_entry(entry, fetch_sha=fetch_sha)
+        new_entry = migrate_entry(entry, sha_map=sha_map)
         migrated.append(new_entry)
 
     if not dry_run:
         with open(filepath, "w", encoding="utf-8") as f:
             f.write("---\n")
-            yaml.dump(migrated, f, default_flow_style=False,
+            yaml.dump(migrated, f, Dumper=SafeDumper, default_flow_style=False,
                       allow_unicode=True, sort_keys=False)
 
     return len(migrated)